@@ -6,21 +6,46 @@ This script creates organized project directories for audio-bench workflows.
 Currently supports 'device_report' project type, with more types planned.
 """
 
-import argparse
+import functools
 import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
+from types import MappingProxyType
 
 
 # Supported project types
-PROJECT_TYPES = {
-    'device_report': {
+PROJECT_TYPES = MappingProxyType({
+    'device_report': MappingProxyType({
         'description': 'Device testing and reporting project',
-        'subdirs': ['data', 'scripts', 'reports']
-    }
+        'subdirs': ('data', 'scripts', 'reports')
+    })
     # Future project types can be added here
-}
+})
+
+# Template for the README.md placed in each new project
+_README_TMPL = """# audio-bench Project Directory
+
+This is an audio-bench project directory.
+
+**Project Type:** {project_type}
+**Created:** {creation_date}
+
+## Directory Structure
+
+- **data/**: Raw data files (WAV files, measurements, etc.)
+- **scripts/**: Python scripts for report generation and analysis
+- **reports/**: Generated output reports and visualizations
+
+## Usage
+
+This project was created for {description}.
+
+Use audio-bench tools to populate the data directory, then run analysis scripts
+to generate reports in the reports directory.
+
+For more information, see the audio-bench documentation.
+"""
 
 
 def create_project_structure(project_type, project_dir):
@@ -34,77 +59,81 @@ def create_project_structure(project_type, project_dir):
     Returns:
         True if successful, False otherwise
     """
-    project_path = Path(project_dir)
-
     # Check if directory already exists
-    if project_path.exists():
+    if os.path.lexists(project_dir):
         print(f"Error: Directory '{project_dir}' already exists", file=sys.stderr)
         return False
 
+    project_path = Path(project_dir)
+
     # Get project configuration
     config = PROJECT_TYPES[project_type]
 
+    # Everything created so far, as (remove function, path) for cleanup
+    created = []
+    # Progress messages, recorded as each step starts and written to
+    # stdout in one go when creation finishes or fails
+    msgs = []
+
     try:
         # Create main project directory
-        print(f"Creating project directory: {project_dir}")
-        project_path.mkdir(parents=True, exist_ok=False)
+        msgs.append(f"Creating project directory: {project_dir}")
+        parent_dir = os.path.dirname(os.path.normpath(project_dir))
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        os.mkdir(project_dir)
+        created.append((os.rmdir, project_dir))
 
         # Create subdirectories
         for subdir in config['subdirs']:
-            subdir_path = project_path / subdir
-            print(f"  Creating subdirectory: {subdir}/")
-            subdir_path.mkdir(exist_ok=False)
+            msgs.append(f"  Creating subdirectory: {subdir}/")
+            subdir_path = os.path.join(project_dir, subdir)
+            os.mkdir(subdir_path)
+            created.append((os.rmdir, subdir_path))
 
         # Create README.md
         readme_path = project_path / 'README.md'
-        creation_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        creation_date = time.strftime('%Y-%m-%d %H:%M:%S')
 
-        readme_content = f"""# audio-bench Project Directory
+        msgs.append("  Creating README.md")
+        created.append((os.unlink, readme_path))
+        readme_path.write_text(_README_TMPL.format_map({
+            'project_type': project_type,
+            'creation_date': creation_date,
+            'description': config['description'].lower(),
+        }), encoding='utf-8')
 
-This is an audio-bench project directory.
-
-**Project Type:** {project_type}
-**Created:** {creation_date}
-
-## Directory Structure
-
-- **data/**: Raw data files (WAV files, measurements, etc.)
-- **scripts/**: Python scripts for report generation and analysis
-- **reports/**: Generated output reports and visualizations
-
-## Usage
-
-This project was created for {config['description'].lower()}.
-
-Use audio-bench tools to populate the data directory, then run analysis scripts
-to generate reports in the reports directory.
-
-For more information, see the audio-bench documentation.
-"""
-
-        print(f"  Creating README.md")
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-
-        print(f"\nProject '{project_dir}' created successfully!")
-        print(f"Project type: {project_type}")
+        msgs.append(f"\nProject '{project_dir}' created successfully!")
+        msgs.append(f"Project type: {project_type}")
+        sys.stdout.write('\n'.join(msgs) + '\n')
 
         return True
 
     except OSError as e:
+        if msgs:
+            sys.stdout.write('\n'.join(msgs) + '\n')
+            sys.stdout.flush()
         print(f"Error creating project structure: {e}", file=sys.stderr)
-        # Attempt cleanup if partial creation occurred
-        if project_path.exists():
-            try:
-                import shutil
-                shutil.rmtree(project_path)
+        # Attempt cleanup if partial creation occurred, newest first
+        if created:
+            cleaned = True
+            for remove, path in reversed(created):
+                try:
+                    remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    cleaned = False
+            if cleaned:
                 print("Cleaned up partial project creation", file=sys.stderr)
-            except Exception:
-                pass
         return False
 
 
-def main():
+@functools.lru_cache(maxsize=None)
+def _parser():
+    """Build the command-line parser (constructed once and reused)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Create audio-bench project directory structure',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -135,7 +164,18 @@ Supported project types:
         help='List available project types and exit'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    # Fast path for the common '<project_type> <project_dir>' invocation:
+    # skip importing and building the argparse parser entirely
+    argv = sys.argv[1:]
+    if len(argv) == 2 and argv[0] in PROJECT_TYPES and not argv[1].startswith('-'):
+        success = create_project_structure(argv[0], argv[1])
+        sys.exit(0 if success else 1)
+
+    args = _parser().parse_args()
 
     # Handle --list-types
     if args.list_types:
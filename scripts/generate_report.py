@@ -7,10 +7,17 @@ and generates a comprehensive report with graphs.
 """
 
 import argparse
+import functools
 import os
+import shutil
 import sys
 import subprocess
-from pathlib import Path
+
+
+@functools.lru_cache(maxsize=None)
+def _have(tool):
+    """Return True if tool is found on PATH (cached per tool)."""
+    return shutil.which(tool) is not None
 
 
 def check_dependencies():
@@ -19,7 +26,7 @@ def check_dependencies():
     missing = []
     
     for tool in required:
-        if subprocess.run(['which', tool], capture_output=True).returncode != 0:
+        if not _have(tool):
             missing.append(tool)
     
     if missing:
@@ -43,15 +50,27 @@ def run_analysis(input_file, output_dir):
     print(f"Analysis complete. Results in {output_dir}")
 
 
+def iter_gnuplot_scripts(directory):
+    """Yield os.DirEntry objects for the .gp files in directory."""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith('.gp') and entry.is_file(follow_symlinks=False):
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
 def generate_graphs(data_dir, output_dir):
     """Generate graphs using gnuplot."""
     print("Generating graphs...")
     
-    gnuplot_scripts = Path('gnuplot').glob('*.gp')
+    # scandir order is arbitrary; process scripts in a stable, sorted order
+    gnuplot_scripts = sorted(iter_gnuplot_scripts('gnuplot'), key=lambda e: e.name)
     
-    for script in gnuplot_scripts:
-        print(f"  Processing {script.name}...")
-        # subprocess.run(['gnuplot', str(script)])
+    for entry in gnuplot_scripts:
+        print(f"  Processing {entry.name}...")
+        # subprocess.run(['gnuplot', entry.path])
     
     print("Graphs generated.")
 
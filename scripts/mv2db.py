@@ -1,15 +1,47 @@
 import math
 
-def db_to_mvp(dB):
-    """Convert dB to mV/Pa"""
-    mvp = 10 ** (dB / 20) * 1000
-    return round(mvp, 4)
-
-def mvp_to_db(mvp):
-    """Convert mV/Pa to dB"""
-    dB = 20 * math.log10(mvp / 1000)
-    return round(dB, 2)
-
-# Example usage:
-print("Convert -26 dB to mV/Pa:", db_to_mvp(-26), "mV/Pa")
-print("Convert 1.8 mV/Pa to dB:", mvp_to_db(1.8), "dB")
+# Precomputed constants: 10 ** (x / 20) == exp(x * ln(10) / 20)
+_LN10_OVER_20 = math.log(10.0) / 20.0
+_20_OVER_LN10 = 20.0 / math.log(10.0)
+_MV_PER_V = 1000.0
+_V_PER_MV = 1e-3
+
+# Lookup table for whole-dB sensitivities, as used on microphone spec sheets
+_DB_LUT = {d: math.exp(d * _LN10_OVER_20) * _MV_PER_V for d in range(-80, 21)}
+
+def db_to_mvp(dB, round_to=4):
+    """Convert dB to mV/Pa (accepts a scalar or an array of dB values)
+
+    Pass round_to=None to skip rounding, e.g. when the result is formatted
+    for output anyway.
+    """
+    if isinstance(dB, (int, float)):
+        mvp = _DB_LUT.get(dB) if isinstance(dB, int) else None
+        if mvp is None:
+            mvp = math.exp(dB * _LN10_OVER_20) * _MV_PER_V
+        return mvp if round_to is None else round(mvp, round_to)
+    import numpy as np
+    mvp = np.exp(np.asarray(dB, dtype=float) * _LN10_OVER_20) * _MV_PER_V
+    if round_to is not None:
+        mvp = np.round(mvp, round_to)
+    return float(mvp) if mvp.ndim == 0 else mvp
+
+def mvp_to_db(mvp, round_to=2):
+    """Convert mV/Pa to dB (accepts a scalar or an array of mV/Pa values)
+
+    Pass round_to=None to skip rounding, e.g. when the result is formatted
+    for output anyway.
+    """
+    if isinstance(mvp, (int, float)):
+        dB = math.log(mvp * _V_PER_MV) * _20_OVER_LN10
+        return dB if round_to is None else round(dB, round_to)
+    import numpy as np
+    dB = np.log(np.asarray(mvp, dtype=float) * _V_PER_MV) * _20_OVER_LN10
+    if round_to is not None:
+        dB = np.round(dB, round_to)
+    return float(dB) if dB.ndim == 0 else dB
+
+if __name__ == '__main__':
+    # Example usage:
+    print(f"Convert -26 dB to mV/Pa: {db_to_mvp(-26, round_to=None):.4f} mV/Pa")
+    print(f"Convert 1.8 mV/Pa to dB: {mvp_to_db(1.8, round_to=None):.2f} dB")